@@ -81,6 +81,21 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/ref/settings/#caches
+# The TODO list caches its counts and invalidates them by bumping a version
+# key once a write commits. The per-process LocMemCache is only shared by the
+# threads of a single worker, as with runserver. Deployments running several
+# worker processes must point this at a shared backend such as Redis or
+# Memcached.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
 from .models import Todo
+from .signals import invalidate_todo_counts
 
 
 @admin.register(Todo)
@@ -27,15 +30,41 @@ class TodoAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
 
     actions = ['mark_resolved', 'mark_unresolved']
+    update_chunk_size = 1000
+
+    def save_model(self, request, obj, form, change):
+        """Save only the changed fields when editing an existing TODO."""
+        if not change:
+            super().save_model(request, obj, form, change)
+        elif form.has_changed():
+            obj.save(update_fields=[*form.changed_data, 'updated_at'])
+
+    def _set_resolved(self, queryset, is_resolved):
+        """Update is_resolved on the selected TODOs in bounded chunks, paging by pk."""
+        ids = queryset.order_by('pk').values_list('pk', flat=True)
+        now = timezone.now()
+        updated = 0
+        last_pk = None
+        while True:
+            page = ids if last_pk is None else ids.filter(pk__gt=last_pk)
+            chunk = list(page[:self.update_chunk_size])
+            if not chunk:
+                break
+            updated += Todo.objects.filter(pk__in=chunk).update(
+                is_resolved=is_resolved, updated_at=now
+            )
+            last_pk = chunk[-1]
+        transaction.on_commit(invalidate_todo_counts)
+        return updated
 
     def mark_resolved(self, request, queryset):
         """Mark selected TODOs as resolved."""
-        updated = queryset.update(is_resolved=True)
+        updated = self._set_resolved(queryset, True)
         self.message_user(request, f'{updated} TODO(s) marked as resolved.')
     mark_resolved.short_description = 'Mark selected TODOs as resolved'
 
     def mark_unresolved(self, request, queryset):
         """Mark selected TODOs as unresolved."""
-        updated = queryset.update(is_resolved=False)
+        updated = self._set_resolved(queryset, False)
         self.message_user(request, f'{updated} TODO(s) marked as unresolved.')
     mark_unresolved.short_description = 'Mark selected TODOs as unresolved'
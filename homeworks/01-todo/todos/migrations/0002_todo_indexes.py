@@ -0,0 +1,36 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="todo",
+            options={
+                "ordering": ["-created_at", "-id"],
+                "verbose_name": "TODO",
+                "verbose_name_plural": "TODOs",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["is_resolved", "-created_at", "-id"],
+                name="todo_resolved_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["-created_at", "-id"], name="todo_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["due_date"], name="todo_due_idx"),
+        ),
+    ]
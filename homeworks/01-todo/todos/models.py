@@ -1,8 +1,20 @@
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.urls import reverse
 
 
+def local_today():
+    """Return today's date in the current time zone, the reference for overdue checks."""
+    return timezone.localdate()
+
+
+def overdue_q(today):
+    """Return a filter matching unresolved TODOs due before today."""
+    return Q(is_resolved=False) & Q(due_date__isnull=False) & Q(due_date__lt=today)
+
+
 class Todo(models.Model):
     """Model representing a TODO item."""
     title = models.CharField(max_length=200, help_text="Title of the TODO")
@@ -13,21 +25,36 @@ class Todo(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
         verbose_name = 'TODO'
         verbose_name_plural = 'TODOs'
+        indexes = [
+            models.Index(fields=['is_resolved', '-created_at', '-id'], name='todo_resolved_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='todo_created_idx'),
+            models.Index(fields=['due_date'], name='todo_due_idx'),
+        ]
 
     def __str__(self):
         """String representation of the TODO."""
         return self.title
 
-    @property
+    def save(self, *args, **kwargs):
+        """Save the TODO, dropping the memoized overdue status."""
+        self.__dict__.pop('is_overdue', None)
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload the TODO, dropping the memoized overdue status."""
+        self.__dict__.pop('is_overdue', None)
+        super().refresh_from_db(*args, **kwargs)
+
+    @cached_property
     def is_overdue(self):
-        """Check if the TODO is overdue."""
+        """Check if the TODO is overdue, computed once per instance."""
         if self.due_date and not self.is_resolved:
-            return self.due_date < timezone.now().date()
+            return self.due_date < local_today()
         return False
 
     def get_absolute_url(self):
         """Returns the URL to access a detail record for this TODO."""
-        return reverse('todo-detail', args=[str(self.id)])
+        return reverse('todo-update', args=[str(self.id)])
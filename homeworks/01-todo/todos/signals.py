@@ -0,0 +1,28 @@
+"""Cache invalidation for TODO counts."""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Todo
+
+COUNT_VERSION_KEY = 'todo:count:ver'
+
+
+def get_count_version():
+    """Return the current version of the cached TODO counts."""
+    return cache.get_or_set(COUNT_VERSION_KEY, 0, None)
+
+
+def invalidate_todo_counts():
+    """Invalidate all cached TODO counts by bumping their version."""
+    try:
+        cache.incr(COUNT_VERSION_KEY)
+    except ValueError:
+        cache.set(COUNT_VERSION_KEY, 1, None)
+
+
+@receiver(post_save, sender=Todo)
+@receiver(post_delete, sender=Todo)
+def todo_changed(sender, **kwargs):
+    """Drop cached counts once a TODO write or removal is committed."""
+    transaction.on_commit(invalidate_todo_counts)
@@ -1,16 +1,26 @@
-from django.test import TestCase, Client
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from datetime import date, timedelta
+from .admin import TodoAdmin
 from .models import Todo
+from .signals import get_count_version
+from .views import TodoForm, TodoUpdateForm, encode_cursor, toggle_resolved
 
 
 class TodoModelTest(TestCase):
     """Test cases for the Todo model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.todo = Todo.objects.create(
+        cls.todo = Todo.objects.create(
             title="Test TODO",
             description="This is a test TODO",
             due_date=date.today() + timedelta(days=7)
@@ -40,6 +50,22 @@ class TodoModelTest(TestCase):
         )
         self.assertTrue(overdue_todo.is_overdue)
 
+    def test_todo_is_overdue_memoized_until_save(self):
+        """Test that is_overdue is cached per instance and reset on save and refresh."""
+        todo = Todo.objects.create(
+            title="Overdue TODO",
+            due_date=date.today() - timedelta(days=1)
+        )
+        self.assertTrue(todo.is_overdue)
+        todo.is_resolved = True
+        self.assertTrue(todo.is_overdue)
+        todo.save()
+        self.assertFalse(todo.is_overdue)
+
+        Todo.objects.filter(pk=todo.pk).update(is_resolved=False)
+        todo.refresh_from_db()
+        self.assertTrue(todo.is_overdue)
+
     def test_completed_todo_not_overdue(self):
         """Test that a completed TODO is never overdue."""
         overdue_todo = Todo.objects.create(
@@ -54,6 +80,10 @@ class TodoModelTest(TestCase):
         no_date_todo = Todo.objects.create(title="No Due Date TODO")
         self.assertFalse(no_date_todo.is_overdue)
 
+    def test_todo_absolute_url(self):
+        """Test that a TODO links to its edit page."""
+        self.assertEqual(self.todo.get_absolute_url(), f'/{self.todo.pk}/edit/')
+
     def test_todo_ordering(self):
         """Test that TODOs are ordered by creation date (newest first)."""
         todo1 = Todo.objects.create(title="First")
@@ -66,15 +96,20 @@ class TodoModelTest(TestCase):
 class TodoListViewTest(TestCase):
     """Test cases for the TodoListView."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.url = reverse('todo-list')
+        cls.todos = Todo.objects.bulk_create([
+            Todo(title="Active TODO 1", is_resolved=False),
+            Todo(title="Active TODO 2", is_resolved=False),
+            Todo(title="Completed TODO", is_resolved=True),
+        ])
+
     def setUp(self):
-        """Set up test client and test data."""
+        """Set up test client and start from an empty cache."""
+        cache.clear()
         self.client = Client()
-        self.url = reverse('todo-list')
-
-        # Create test TODOs
-        Todo.objects.create(title="Active TODO 1", is_resolved=False)
-        Todo.objects.create(title="Active TODO 2", is_resolved=False)
-        Todo.objects.create(title="Completed TODO", is_resolved=True)
 
     def test_list_view_status_code(self):
         """Test that the list view returns a 200 status code."""
@@ -91,6 +126,12 @@ class TodoListViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(len(response.context['todos']), 3)
 
+    def test_list_view_defers_unused_columns(self):
+        """Test that the list view does not load columns the template never shows."""
+        response = self.client.get(self.url)
+        for todo in response.context['todos']:
+            self.assertIn('updated_at', todo.get_deferred_fields())
+
     def test_list_view_filter_active(self):
         """Test filtering active TODOs."""
         response = self.client.get(self.url + '?status=active')
@@ -105,6 +146,42 @@ class TodoListViewTest(TestCase):
         for todo in response.context['todos']:
             self.assertTrue(todo.is_resolved)
 
+    def test_list_view_filter_overdue(self):
+        """Test filtering overdue TODOs."""
+        overdue, _ = Todo.objects.bulk_create([
+            Todo(title="Overdue TODO", due_date=date.today() - timedelta(days=1)),
+            Todo(
+                title="Completed Overdue TODO",
+                due_date=date.today() - timedelta(days=1),
+                is_resolved=True
+            ),
+        ])
+        response = self.client.get(self.url + '?status=overdue')
+        self.assertEqual(list(response.context['todos']), [overdue])
+
+    def test_list_view_annotates_overdue(self):
+        """Test that the overdue flag computed in SQL matches the model property."""
+        Todo.objects.bulk_create([
+            Todo(title="Overdue TODO", due_date=date.today() - timedelta(days=1)),
+            Todo(title="Upcoming TODO", due_date=date.today() + timedelta(days=1)),
+        ])
+        response = self.client.get(self.url)
+        for todo in response.context['todos']:
+            self.assertEqual(bool(todo.is_overdue_db), todo.is_overdue)
+
+    @override_settings(TIME_ZONE='Pacific/Kiritimati')
+    def test_list_view_overdue_uses_local_date(self):
+        """Test that SQL and Python overdue checks agree outside UTC."""
+        today = timezone.localdate()
+        Todo.objects.bulk_create([
+            Todo(title="Due UTC today", due_date=timezone.now().date()),
+            Todo(title="Due yesterday", due_date=today - timedelta(days=1)),
+            Todo(title="Due today", due_date=today),
+        ])
+        response = self.client.get(self.url)
+        for todo in response.context['todos']:
+            self.assertEqual(bool(todo.is_overdue_db), todo.is_overdue)
+
     def test_list_view_context_data(self):
         """Test that context contains correct counts."""
         response = self.client.get(self.url)
@@ -112,6 +189,103 @@ class TodoListViewTest(TestCase):
         self.assertEqual(response.context['active_count'], 2)
         self.assertEqual(response.context['completed_count'], 1)
 
+    def test_list_view_query_count_cold_cache(self):
+        """Test the queries run when nothing is cached: stats, page count and page rows."""
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+    def test_list_view_query_count_warm_cache(self):
+        """Test that only the page rows are queried once counts are cached."""
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_list_view_stats_invalidated_on_save(self):
+        """Test that cached stats are refreshed after a TODO changes."""
+        self.client.get(self.url)
+        todo = Todo.objects.filter(is_resolved=False).first()
+        todo.is_resolved = True
+        with self.captureOnCommitCallbacks(execute=True):
+            todo.save(update_fields=['is_resolved', 'updated_at'])
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['active_count'], 1)
+        self.assertEqual(response.context['completed_count'], 2)
+
+    def test_list_view_paginator_count_invalidated_on_save(self):
+        """Test that the cached paginator count is refreshed after a write."""
+        response = self.client.get(self.url + '?status=active')
+        self.assertEqual(response.context['paginator'].count, 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            Todo.objects.create(title="Active TODO 3", is_resolved=False)
+        response = self.client.get(self.url + '?status=active')
+        self.assertEqual(response.context['paginator'].count, 3)
+
+    def test_list_view_paginator_count_invalidated_on_delete(self):
+        """Test that the cached paginator count is refreshed after a delete."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['paginator'].count, 3)
+        with self.captureOnCommitCallbacks(execute=True):
+            Todo.objects.filter(is_resolved=True).delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['paginator'].count, 2)
+
+    def test_count_version_bumped_only_on_commit(self):
+        """Test that a write inside atomic() invalidates counts only once committed."""
+        version = get_count_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Todo.objects.create(title="Active TODO 3", is_resolved=False)
+                self.assertEqual(get_count_version(), version)
+            self.assertEqual(get_count_version(), version)
+        self.assertEqual(get_count_version(), version + 1)
+
+
+class TodoListKeysetPaginationTest(TestCase):
+    """Test cases for keyset pagination on the TodoListView."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up more TODOs than fit on one page, sharing a creation time."""
+        cls.url = reverse('todo-list')
+        Todo.objects.bulk_create([Todo(title=f"TODO {i}") for i in range(13)])
+        Todo.objects.update(created_at=timezone.now())
+        cls.expected = list(Todo.objects.order_by('-created_at', '-id'))
+
+    def setUp(self):
+        """Set up test client and start from an empty cache."""
+        cache.clear()
+        self.client = Client()
+
+    def test_first_page_links_next_cursor(self):
+        """Test that the first offset page exposes a cursor for the next page."""
+        response = self.client.get(self.url)
+        self.assertEqual(list(response.context['todos']), self.expected[:10])
+        self.assertEqual(response.context['next_cursor'], encode_cursor(self.expected[9]))
+
+    def test_after_cursor_returns_next_page(self):
+        """Test that rows after the cursor are returned, breaking ties on id."""
+        response = self.client.get(self.url, {'after': encode_cursor(self.expected[9])})
+        self.assertEqual(response.context['todos'], self.expected[10:])
+        self.assertIsNone(response.context['next_cursor'])
+        self.assertEqual(response.context['prev_cursor'], encode_cursor(self.expected[10]))
+
+    def test_before_cursor_returns_previous_page(self):
+        """Test that rows before the cursor are returned in list order."""
+        response = self.client.get(self.url, {'before': encode_cursor(self.expected[10])})
+        self.assertEqual(response.context['todos'], self.expected[:10])
+        self.assertIsNone(response.context['prev_cursor'])
+        self.assertEqual(response.context['next_cursor'], encode_cursor(self.expected[9]))
+
+    def test_keyset_page_skips_count(self):
+        """Test that a keyset page runs only the stats and page queries."""
+        with self.assertNumQueries(2):
+            self.client.get(self.url, {'after': encode_cursor(self.expected[9])})
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor returns a 404."""
+        response = self.client.get(self.url, {'after': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
 
 class TodoCreateViewTest(TestCase):
     """Test cases for the TodoCreateView."""
@@ -164,17 +338,37 @@ class TodoCreateViewTest(TestCase):
         self.assertEqual(Todo.objects.count(), 0)
 
 
+class TodoFormTest(TestCase):
+    """Test cases for the TODO forms."""
+
+    def test_forms_share_class_level_fields(self):
+        """Test that form instances reuse field objects rather than copies."""
+        first, second = TodoUpdateForm(), TodoUpdateForm()
+        self.assertIs(first.fields['due_date'], TodoUpdateForm.base_fields['due_date'])
+        self.assertIs(first.fields['is_resolved'], second.fields['is_resolved'])
+
+    def test_field_mapping_is_per_instance(self):
+        """Test that changing one form's field mapping leaves others untouched."""
+        form = TodoForm()
+        del form.fields['description']
+        self.assertIn('description', TodoForm().fields)
+
+
 class TodoUpdateViewTest(TestCase):
     """Test cases for the TodoUpdateView."""
 
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.todo = Todo.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.todo = Todo.objects.create(
             title="Original Title",
             description="Original description"
         )
-        self.url = reverse('todo-update', args=[self.todo.pk])
+        cls.url = reverse('todo-update', args=[cls.todo.pk])
+
+    def setUp(self):
+        """Set up test client."""
+        self.client = Client()
 
     def test_update_view_status_code(self):
         """Test that the update view returns a 200 status code."""
@@ -200,6 +394,20 @@ class TodoUpdateViewTest(TestCase):
         self.assertEqual(self.todo.description, 'Updated description')
         self.assertTrue(self.todo.is_resolved)
 
+    def test_update_writes_only_changed_columns(self):
+        """Test that saving the edit form rewrites only the fields that changed."""
+        data = {
+            'title': 'Original Title',
+            'description': 'Original description',
+            'is_resolved': True
+        }
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, data)
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"is_resolved"', updates[0])
+        self.assertNotIn('"description"', updates[0])
+
     def test_update_nonexistent_todo(self):
         """Test updating a TODO that doesn't exist."""
         url = reverse('todo-update', args=[99999])
@@ -210,11 +418,15 @@ class TodoUpdateViewTest(TestCase):
 class TodoDeleteViewTest(TestCase):
     """Test cases for the TodoDeleteView."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.todo = Todo.objects.create(title="To Be Deleted")
+        cls.url = reverse('todo-delete', args=[cls.todo.pk])
+
     def setUp(self):
-        """Set up test client and test data."""
+        """Set up test client."""
         self.client = Client()
-        self.todo = Todo.objects.create(title="To Be Deleted")
-        self.url = reverse('todo-delete', args=[self.todo.pk])
 
     def test_delete_view_status_code(self):
         """Test that the delete view returns a 200 status code."""
@@ -232,6 +444,12 @@ class TodoDeleteViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(Todo.objects.count(), 0)
 
+    def test_delete_todo_success_message(self):
+        """Test that deleting a TODO displays a success message."""
+        response = self.client.post(self.url, follow=True)
+        messages = [str(m) for m in response.context['messages']]
+        self.assertEqual(messages, ['TODO "To Be Deleted" deleted successfully!'])
+
     def test_delete_nonexistent_todo(self):
         """Test deleting a TODO that doesn't exist."""
         url = reverse('todo-delete', args=[99999])
@@ -242,18 +460,29 @@ class TodoDeleteViewTest(TestCase):
 class TodoToggleResolvedTest(TestCase):
     """Test cases for the toggle_resolved view."""
 
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.todo = Todo.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.todo = Todo.objects.create(
             title="Toggle Test",
             is_resolved=False
         )
-        self.url = reverse('todo-toggle', args=[self.todo.pk])
+        cls.url = reverse('todo-toggle', args=[cls.todo.pk])
+
+    def setUp(self):
+        """Set up test client and request factory."""
+        self.client = Client()
+        self.factory = RequestFactory()
+
+    def toggle(self, pk):
+        """Call toggle_resolved directly, bypassing the middleware stack."""
+        request = self.factory.post(self.url)
+        request._messages = CookieStorage(request)
+        return toggle_resolved(request, pk=pk)
 
     def test_toggle_resolved_to_true(self):
         """Test toggling a TODO from unresolved to resolved."""
-        response = self.client.post(self.url)
+        response = self.toggle(self.todo.pk)
         self.assertEqual(response.status_code, 302)
         self.todo.refresh_from_db()
         self.assertTrue(self.todo.is_resolved)
@@ -261,12 +490,36 @@ class TodoToggleResolvedTest(TestCase):
     def test_toggle_resolved_to_false(self):
         """Test toggling a TODO from resolved to unresolved."""
         self.todo.is_resolved = True
-        self.todo.save()
-        response = self.client.post(self.url)
+        self.todo.save(update_fields=['is_resolved', 'updated_at'])
+        response = self.toggle(self.todo.pk)
         self.assertEqual(response.status_code, 302)
         self.todo.refresh_from_db()
         self.assertFalse(self.todo.is_resolved)
 
+    def test_toggle_updates_only_changed_columns(self):
+        """Test that toggling issues one UPDATE that writes only the changed columns."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.toggle(self.todo.pk)
+        self.assertEqual(response.status_code, 302)
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"is_resolved"', updates[0])
+        self.assertNotIn('"description"', updates[0])
+
+    def test_toggle_invalidates_counts_on_commit(self):
+        """Test that toggling bumps the count version only once committed."""
+        version = get_count_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.toggle(self.todo.pk)
+            self.assertEqual(get_count_version(), version)
+        self.assertEqual(get_count_version(), version + 1)
+
+    def test_toggle_success_message(self):
+        """Test that toggling displays a success message."""
+        response = self.client.post(self.url, follow=True)
+        messages = [str(m) for m in response.context['messages']]
+        self.assertEqual(messages, ['TODO "Toggle Test" marked as completed!'])
+
     def test_toggle_nonexistent_todo(self):
         """Test toggling a TODO that doesn't exist."""
         url = reverse('todo-toggle', args=[99999])
@@ -274,6 +527,84 @@ class TodoToggleResolvedTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+class TodoAdminActionTest(TestCase):
+    """Test cases for the TodoAdmin bulk actions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        Todo.objects.bulk_create([Todo(title=f"TODO {i}") for i in range(5)])
+
+    def setUp(self):
+        """Set up the admin."""
+        self.admin = TodoAdmin(Todo, AdminSite())
+        self.admin.message_user = lambda request, message: None
+        self.admin.update_chunk_size = 2
+
+    def test_mark_resolved_updates_all_chunks(self):
+        """Test that every selected TODO is resolved across chunks."""
+        self.admin.mark_resolved(None, Todo.objects.all())
+        self.assertEqual(Todo.objects.filter(is_resolved=True).count(), 5)
+
+    def test_mark_resolved_on_filtered_selection(self):
+        """Test that chunks page correctly when updates change the selection's filter."""
+        self.admin.mark_resolved(None, Todo.objects.filter(is_resolved=False))
+        self.assertEqual(Todo.objects.filter(is_resolved=True).count(), 5)
+
+    def test_mark_resolved_bumps_updated_at(self):
+        """Test that bulk updates refresh the updated_at timestamp."""
+        before = timezone.now()
+        self.admin.mark_resolved(None, Todo.objects.all())
+        self.assertFalse(Todo.objects.filter(updated_at__lt=before).exists())
+
+    def test_mark_resolved_invalidates_counts_on_commit(self):
+        """Test that the bulk action bumps the count version only once committed."""
+        version = get_count_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin.mark_resolved(None, Todo.objects.all())
+            self.assertEqual(get_count_version(), version)
+        self.assertEqual(get_count_version(), version + 1)
+
+    def test_mark_unresolved(self):
+        """Test marking resolved TODOs as unresolved."""
+        Todo.objects.update(is_resolved=True)
+        self.admin.mark_unresolved(None, Todo.objects.all())
+        self.assertEqual(Todo.objects.filter(is_resolved=False).count(), 5)
+
+
+class TodoAdminChangeFormTest(TestCase):
+    """Test cases for saving TODOs through the admin change form."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up an admin user and test data."""
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        cls.todo = Todo.objects.create(title="Admin TODO", description="Long description")
+        cls.url = reverse('admin:todos_todo_change', args=[cls.todo.pk])
+
+    def setUp(self):
+        """Log in the admin user."""
+        self.client.force_login(self.user)
+
+    def test_change_writes_only_changed_columns(self):
+        """Test that the admin change form rewrites only the fields that changed."""
+        data = {
+            'title': 'Admin TODO',
+            'description': 'Long description',
+            'is_resolved': 'on',
+            'due_date': '',
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 302)
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE "todos_todo"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"is_resolved"', updates[0])
+        self.assertNotIn('"description"', updates[0])
+        self.todo.refresh_from_db()
+        self.assertTrue(self.todo.is_resolved)
+
+
 class URLTest(TestCase):
     """Test cases for URL resolution."""
 
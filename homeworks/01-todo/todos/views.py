@@ -1,9 +1,26 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import Http404, HttpResponseRedirect
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 from django.contrib import messages
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django import forms
-from .models import Todo
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, ExpressionWrapper, Q, Value, When
+from django.utils import timezone
+from .models import Todo, local_today, overdue_q
+from .signals import get_count_version, invalidate_todo_counts
+
+
+class SharedFields(dict):
+    """Field mapping that survives deepcopy by reference, so field instances are shared."""
+
+    def __deepcopy__(self, memo):
+        return self
 
 
 class TodoForm(forms.ModelForm):
@@ -21,6 +38,14 @@ class TodoForm(forms.ModelForm):
         model = Todo
         fields = ['title', 'description', 'due_date']
 
+    def __init__(self, *args, **kwargs):
+        """Reuse the class-level fields instead of deep-copying them per form.
+
+        Safe because these forms never mutate their fields or widgets per instance.
+        """
+        self.base_fields = SharedFields(type(self).base_fields)
+        super().__init__(*args, **kwargs)
+
 
 class TodoUpdateForm(TodoForm):
     """Form for updating TODO with is_resolved field."""
@@ -29,32 +54,142 @@ class TodoUpdateForm(TodoForm):
         fields = ['title', 'description', 'due_date', 'is_resolved']
 
 
+STATUS_FILTERS = {
+    'active': lambda today: Q(is_resolved=False),
+    'completed': lambda today: Q(is_resolved=True),
+    'overdue': overdue_q,
+}
+
+STATS_TIMEOUT = 300
+
+
+def get_todo_stats():
+    """Return total, active and completed TODO counts, cached until the next write."""
+    def compute():
+        return Todo.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_resolved=False)),
+            completed=Count('id', filter=Q(is_resolved=True)),
+        )
+
+    return cache.get_or_set(f'todo:stats:v{get_count_version()}', compute, STATS_TIMEOUT)
+
+
+CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_cursor(todo):
+    """Encode a TODO's (created_at, id) position as a URL-safe cursor."""
+    micros = (todo.created_at - CURSOR_EPOCH) // timedelta(microseconds=1)
+    return f'{micros}_{todo.pk}'
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into a (created_at, id) pair, raising Http404 if malformed."""
+    try:
+        micros, pk = cursor.split('_')
+        return CURSOR_EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (ValueError, OverflowError):
+        raise Http404('Invalid cursor.')
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that caches the total object count under a given key."""
+    count_timeout = 30
+
+    def __init__(self, *args, cache_key, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+
+    @cached_property
+    def count(self):
+        """Return the cached object count, computing it on a miss."""
+        count = cache.get(self.cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.cache_key, count, self.count_timeout)
+        return count
+
+
 class TodoListView(ListView):
     """View to display all TODOs with filtering options."""
     model = Todo
     template_name = 'todos/home.html'
     context_object_name = 'todos'
     paginate_by = 10
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         """Filter TODOs based on status parameter."""
-        queryset = super().get_queryset()
-        status = self.request.GET.get('status', 'all')
-
-        if status == 'active':
-            queryset = queryset.filter(is_resolved=False)
-        elif status == 'completed':
-            queryset = queryset.filter(is_resolved=True)
+        queryset = super().get_queryset().only(
+            'id', 'title', 'description', 'due_date', 'is_resolved', 'created_at'
+        )
+        self.today = local_today()
+        queryset = queryset.annotate(
+            is_overdue_db=ExpressionWrapper(overdue_q(self.today), output_field=BooleanField())
+        )
+
+        status_filter = STATUS_FILTERS.get(self.request.GET.get('status'))
+        if status_filter:
+            queryset = queryset.filter(status_filter(self.today))
 
         return queryset
 
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate by offset, or by keyset when an after/before cursor is given."""
+        self.next_cursor = self.prev_cursor = None
+        after = self.request.GET.get('after')
+        before = self.request.GET.get('before')
+
+        if not after and not before:
+            paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+            if page.has_next():
+                self.next_cursor = encode_cursor(list(object_list)[-1])
+            return paginator, page, object_list, is_paginated
+
+        if after:
+            created_at, pk = decode_cursor(after)
+            rows = list(queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            ).order_by('-created_at', '-id')[:page_size + 1])
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            if rows:
+                self.prev_cursor = encode_cursor(rows[0])
+                if has_more:
+                    self.next_cursor = encode_cursor(rows[-1])
+        else:
+            created_at, pk = decode_cursor(before)
+            rows = list(queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+            ).order_by('created_at', 'id')[:page_size + 1])
+            has_more = len(rows) > page_size
+            rows = rows[:page_size][::-1]
+            if rows:
+                self.next_cursor = encode_cursor(rows[-1])
+                if has_more:
+                    self.prev_cursor = encode_cursor(rows[0])
+
+        return None, None, rows, False
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Key the cached count on the status filter and current count version."""
+        status = self.request.GET.get('status', 'all')
+        if status not in STATUS_FILTERS:
+            status = 'all'
+        cache_key = f'todo:count:v{get_count_version()}:{status}'
+        return super().get_paginator(queryset, per_page, cache_key=cache_key, **kwargs)
+
     def get_context_data(self, **kwargs):
         """Add additional context for the template."""
         context = super().get_context_data(**kwargs)
         context['current_filter'] = self.request.GET.get('status', 'all')
-        context['total_count'] = Todo.objects.count()
-        context['active_count'] = Todo.objects.filter(is_resolved=False).count()
-        context['completed_count'] = Todo.objects.filter(is_resolved=True).count()
+        context['next_cursor'] = self.next_cursor
+        context['prev_cursor'] = self.prev_cursor
+        counts = get_todo_stats()
+        context['total_count'] = counts['total']
+        context['active_count'] = counts['active']
+        context['completed_count'] = counts['completed']
         return context
 
 
@@ -79,9 +214,12 @@ class TodoUpdateView(UpdateView):
     success_url = reverse_lazy('todo-list')
 
     def form_valid(self, form):
-        """Add success message when TODO is updated."""
+        """Save only the changed fields and add success message when TODO is updated."""
         messages.success(self.request, f'TODO "{form.instance.title}" updated successfully!')
-        return super().form_valid(form)
+        self.object = form.save(commit=False)
+        if form.has_changed():
+            self.object.save(update_fields=[*form.changed_data, 'updated_at'])
+        return HttpResponseRedirect(self.get_success_url())
 
 
 class TodoDeleteView(DeleteView):
@@ -90,20 +228,28 @@ class TodoDeleteView(DeleteView):
     template_name = 'todos/todo_confirm_delete.html'
     success_url = reverse_lazy('todo-list')
 
-    def delete(self, request, *args, **kwargs):
+    def form_valid(self, form):
         """Add success message when TODO is deleted."""
-        todo = self.get_object()
-        messages.success(request, f'TODO "{todo.title}" deleted successfully!')
-        return super().delete(request, *args, **kwargs)
+        messages.success(self.request, f'TODO "{self.object.title}" deleted successfully!')
+        return super().form_valid(form)
 
 
 def toggle_resolved(request, pk):
     """Toggle the resolved status of a TODO."""
-    todo = get_object_or_404(Todo, pk=pk)
-    todo.is_resolved = not todo.is_resolved
-    todo.save()
+    updated = Todo.objects.filter(pk=pk).update(
+        is_resolved=Case(
+            When(is_resolved=True, then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField(),
+        ),
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        raise Http404('No TODO matches the given query.')
+    transaction.on_commit(invalidate_todo_counts)
 
-    status = "completed" if todo.is_resolved else "reopened"
-    messages.success(request, f'TODO "{todo.title}" marked as {status}!')
+    todo = Todo.objects.filter(pk=pk).values('title', 'is_resolved').get()
+    status = "completed" if todo['is_resolved'] else "reopened"
+    messages.success(request, f'TODO "{todo["title"]}" marked as {status}!')
 
     return redirect('todo-list')